@@ -1,19 +1,46 @@
 import pandas as pd
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
+import random
+import asyncio
 import os
+import tempfile
 import json
+import functools
+import unicodedata
+import pickle
 import logging
-from datetime import datetime, timedelta
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from nba_api.stats.static import players, teams
 from nba_api.stats.endpoints import playergamelog, teamgamelog, boxscoretraditionalv2
+from nba_api.stats.library.http import NBAStatsHTTP
 from nba_api.stats.library.parameters import SeasonAll, SeasonType
 from xgboost import XGBRegressor
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import mean_absolute_error
 from sklearn.preprocessing import StandardScaler
 
+# requests-cache is optional: when installed, raw HTTP responses are also cached in SQLite
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# pyarrow is optional: without it game logs are saved as CSV instead of Parquet
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
 
 ## We scrape on game-by-game data with the intention of predicting the stats of the next game
 ## (obv, but AI usually starts with seasonal data -- so this should be specified)
@@ -37,77 +64,537 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+def _normalize_name(name):
+    """Lowercase a name and strip accents, so "Luka Doncic" matches "Luka Dončić"."""
+    decomposed = unicodedata.normalize('NFKD', name)
+    return ''.join(c for c in decomposed if not unicodedata.combining(c)).lower()
+
+
+def _downcast(df):
+    """
+    Downcast numeric columns to the smallest dtype that holds their values.
+    
+    Box score counts fit in int8/int16 and percentages in float32, which halves
+    the memory (and bandwidth) of every later vectorized operation on the frame.
+    
+    Args:
+        df (pandas.DataFrame): Frame to downcast in place
+        
+    Returns:
+        pandas.DataFrame: The same frame
+    """
+    for col in df.select_dtypes(include='number').columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer' if df[col].dtype.kind in 'iu' else 'float')
+    return df
+
+
+def _rolling_mean(values, window):
+    """
+    Trailing moving average computed from a single cumulative sum.
+    
+    Matches pandas' rolling(window).mean(): the first window - 1 entries are
+    NaN, as is any window containing a NaN (e.g. FG3_PCT with no attempts).
+    
+    Args:
+        values (array-like): Values to average, in game order
+        window (int): Number of games per average
+        
+    Returns:
+        numpy.ndarray: Rolling averages, same length as values
+    """
+    values = np.asarray(values, dtype=np.float64)
+    valid = ~np.isnan(values)
+    
+    # NaNs add nothing to the sums; counting valid entries tells which windows held one
+    cumsum = np.concatenate(([0.0], np.cumsum(np.where(valid, values, 0.0))))
+    counts = np.concatenate(([0], np.cumsum(valid)))
+    
+    rolling = np.full(len(values), np.nan)
+    window_sums = cumsum[window:] - cumsum[:-window]
+    window_counts = counts[window:] - counts[:-window]
+    rolling[window - 1:] = np.where(window_counts == window, window_sums / window, np.nan)
+    return rolling
+
+
+def _is_json_response(response):
+    """
+    Tell whether an HTTP response body is valid JSON.
+    
+    stats.nba.com sometimes answers with a 200 throttle/HTML page, which must
+    never be stored in the HTTP response cache.
+    
+    Args:
+        response (requests.Response): Response to check
+        
+    Returns:
+        bool: True if the body parses as JSON
+    """
+    try:
+        response.json()
+    except ValueError:
+        return False
+    return True
+
+
+def _parse_id(value):
+    """Return value as an integer ID if it is an int or a string of digits, None otherwise."""
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value)
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _find_player_matches(name):
+    """
+    Search the static player list by full, first, then last name.
+    
+    Memoized, since the nba_api searches scan every player on each call.
+    
+    Args:
+        name (str): Lowercased full or partial player name
+        
+    Returns:
+        tuple: Matching player dicts (empty if none found)
+    """
+    player_matches = players.find_players_by_full_name(name)
+    
+    if not player_matches:
+        # Try partial name search if full name search fails
+        player_matches = players.find_players_by_first_name(name.split()[0])
+        if not player_matches and len(name.split()) > 1:
+            player_matches = players.find_players_by_last_name(name.split()[-1])
+            
+    return tuple(player_matches)
+
+
+@functools.lru_cache(maxsize=4096)
+def _find_team_matches(name):
+    """
+    Search the static team list by full name, abbreviation, then nickname.
+    
+    Args:
+        name (str): Lowercased full or partial team name
+        
+    Returns:
+        tuple: Matching team dicts (empty if none found)
+    """
+    team_matches = teams.find_teams_by_full_name(name)
+    
+    if not team_matches:
+        # Try abbreviation search
+        team_matches = teams.find_teams_by_abbreviation(name)
+        
+    if not team_matches:
+        # Try nickname search
+        team_matches = teams.find_teams_by_nickname(name)
+        
+    return tuple(team_matches)
+
+
+# Set NBA_DEMO_VISUALIZE=0 to skip the demo's comparison plots (e.g., in CI or headless runs)
+VISUALIZE = os.environ.get('NBA_DEMO_VISUALIZE', '1') == '1'
+
+# IDs of the players and teams used in the demos. These never change, so the demos
+# can skip the name search for them (the static tables are still loaded elsewhere)
+KNOWN_PLAYER_IDS = {
+    "Luka Doncic": 1629029,
+    "LeBron James": 2544,
+    "Stephen Curry": 201939,
+    "Giannis Antetokounmpo": 203507,
+    "Karl-Anthony Towns": 1626157,
+}
+KNOWN_TEAM_IDS = {
+    "Los Angeles Lakers": 1610612747,
+    "Oklahoma City Thunder": 1610612760,
+    "Orlando Magic": 1610612753,
+    "Miami Heat": 1610612748,
+}
+
+# Low-cardinality string columns of the game logs, stored as categoricals
+CATEGORICAL_COLUMNS = ('SEASON_ID', 'MATCHUP', 'WL')
+
+# Part of the game-log cache keys, since the cache stores processed logs: bump it whenever
+# _prepare_player_game_log/_prepare_team_game_log change, so old entries become misses
+GAME_LOG_CACHE_VERSION = 2
+
+# Errors worth retrying: timeouts, dropped connections, and the non-JSON pages
+# stats.nba.com serves when it is throttling us
+RETRYABLE_ERRORS = (requests.exceptions.Timeout, requests.exceptions.ConnectionError, json.JSONDecodeError)
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket that limits how often requests are sent.
+    
+    Tokens refill continuously at `rate` per second up to `capacity`, so short
+    bursts go out immediately while sustained load is held to `rate`.
+    """
+    def __init__(self, rate=1.0, capacity=3):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            rate (float): Tokens added per second (sustained requests per second)
+            capacity (int): Maximum number of stored tokens (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+        
+    def acquire(self):
+        """Take one token, sleeping until one is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+            
+            # Reserve the token right away (the balance may go negative) so concurrent
+            # callers queue up behind each other instead of all waking at once
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+            
+        if wait > 0:
+            logger.debug(f"Rate limiting: sleeping for {wait:.2f} seconds")
+            time.sleep(wait)
+
+
 class NBADataScraper:
-    def __init__(self, season="2024-25", season_type=SeasonType.regular):
+    def __init__(self, season="2024-25", season_type=SeasonType.regular, save_format="parquet",
+                 requests_per_second=0.5, request_burst=2):
         """
         Initialize the NBA Data Scraper.
         
         Args:
             season (str): Season to scrape data for (e.g., "2024-25")
             season_type: Type of season (regular, playoffs, etc.)
+            save_format (str): File format for saved data, "parquet" or "csv"
+            requests_per_second (float): Sustained rate of requests sent to stats.nba.com
+            request_burst (int): Number of requests that may be sent back-to-back
         """
+        if save_format not in ("parquet", "csv"):
+            raise ValueError(f"Unsupported save format '{save_format}', expected 'parquet' or 'csv'")
+            
         self.season = season
         self.season_type = season_type
+        self.save_format = save_format
+        if self.save_format == "parquet" and pyarrow is None:
+            logger.warning("pyarrow is not installed, saving data as CSV instead of Parquet")
+            self.save_format = "csv"
         
         # Create directories for storing data if they don't exist
         self.data_dir = "nba_data"
         self.player_data_dir = os.path.join(self.data_dir, "players")
         self.team_data_dir = os.path.join(self.data_dir, "teams")
         self.boxscore_data_dir = os.path.join(self.data_dir, "boxscores")
+        self.cache_dir = os.path.join(self.data_dir, "http_cache")
         
-        for directory in [self.data_dir, self.player_data_dir, self.team_data_dir, self.boxscore_data_dir]:
+        for directory in [self.data_dir, self.player_data_dir, self.team_data_dir, self.boxscore_data_dir, self.cache_dir]:
             if not os.path.exists(directory):
                 os.makedirs(directory)
                 logger.info(f"Created directory: {directory}")
         
-        # Try to get all teams data
+        # Static team and player tables (teams_data, team_id_to_abbr, player_id_to_info, ...)
+        # are loaded lazily on first use, see the properties below
+        
+        # Pace requests to avoid hitting rate limits, and back off on transient failures
+        # (by default one request every two seconds, with bursts of two)
+        self.rate_limiter = RateLimiter(rate=requests_per_second, capacity=request_burst)
+        self.max_retries = 2
+        self.retry_backoff = 2  # seconds before the first retry, doubled on each attempt
+        
+        # Cached API responses for completed seasons never change, so they never expire;
+        # responses for the season in progress are refetched after 12 hours
+        self.season_complete = season != SeasonAll.current_season
+        self.in_progress_ttl = 12 * 60 * 60
+        self.cache_ttl = None if self.season_complete else self.in_progress_ttl
+            
+        # Route every stats.nba.com request through one pooled keep-alive session, so
+        # connections (and their TLS handshakes) are reused instead of reopened per call
+        self.session = self._create_session()
+        self._session_lock = threading.Lock()
+        NBAStatsHTTP._session = self.session
+        
+        # One figure is reused (cleared) for every comparison plot instead of creating
+        # a new one per call; the lock keeps concurrent callers from drawing over each other
+        self._viz_fig, self._viz_ax = None, None
+        self._viz_lock = threading.Lock()
+        
+        # Processed game logs from this session, keyed by player/team ID
+        self._player_log_cache = {}
+        self._team_log_cache = {}
+        
+            
+    @functools.cached_property
+    def teams_data(self):
+        """list: Static team data, loaded on first use."""
         try:
-            self.teams_data = teams.get_teams()
-            logger.info(f"Successfully loaded data for {len(self.teams_data)} teams")
+            teams_data = teams.get_teams()
+            logger.info(f"Successfully loaded data for {len(teams_data)} teams")
         except Exception as e:
-            self.teams_data = []
+            teams_data = []
             logger.error(f"Failed to load teams data: {str(e)}")
-            
-        # Map team ID to team abbr for easier reference
-        self.team_id_to_abbr = {}
+        return teams_data
+        
+    @functools.cached_property
+    def teams_soa(self):
+        """dict: Column-wise copy of the team table (one array per field) for vectorized joins and filters."""
+        team_fields = self.teams_data[0].keys() if self.teams_data else ['id', 'abbreviation']
+        return {field: np.array([team[field] for team in self.teams_data]) for field in team_fields}
+        
+    @functools.cached_property
+    def team_id_to_abbr(self):
+        """pandas.Series: Team abbreviations indexed by team ID."""
+        return pd.Series(self.teams_soa['abbreviation'], index=self.teams_soa['id'])
+        
+    @functools.cached_property
+    def teams_by_name(self):
+        """dict: Team IDs keyed by normalized full name, abbreviation and nickname."""
+        teams_by_name = {}
         for team in self.teams_data:
-            self.team_id_to_abbr[team['id']] = team['abbreviation']
+            for name in (team['full_name'], team['abbreviation'], team['nickname']):
+                teams_by_name[_normalize_name(name)] = team['id']
+        return teams_by_name
+        
+    @functools.cached_property
+    def _player_index(self):
+        """Index the static player list by ID and by normalized full name in one pass."""
+        player_id_to_info = {}
+        players_by_name = defaultdict(list)
+        try:
+            for player in players.get_players():
+                player_id_to_info[player['id']] = player
+                players_by_name[_normalize_name(player['full_name'])].append(player)
+            logger.info(f"Successfully loaded data for {len(player_id_to_info)} players")
+        except Exception as e:
+            logger.error(f"Failed to load players data: {str(e)}")
+        return player_id_to_info, players_by_name
+        
+    @property
+    def player_id_to_info(self):
+        """dict: Player info keyed by player ID."""
+        return self._player_index[0]
+        
+    @property
+    def players_by_name(self):
+        """dict: Lists of player info keyed by normalized full name."""
+        return self._player_index[1]
+        
+    def close(self):
+        """Close the shared HTTP session and the shared visualization figure."""
+        if NBAStatsHTTP._session is self.session:
+            NBAStatsHTTP._session = None
+        self.session.close()
+        
+        # The figure isn't registered with pyplot, so dropping it is enough
+        self._viz_fig, self._viz_ax = None, None
+        
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+            
+    def _create_session(self):
+        """
+        Create the pooled HTTP session used for stats.nba.com requests.
+        
+        With requests-cache installed the session also answers repeat requests from disk.
+        
+        Returns:
+            requests.Session: The new session
+        """
+        if requests_cache is not None:
+            session = requests_cache.CachedSession(
+                os.path.join(self.cache_dir, "http_responses"),
+                backend='sqlite',
+                expire_after=self.cache_ttl if self.cache_ttl is not None else requests_cache.NEVER_EXPIRE,
+                # Only cache real API payloads, so a retry after a bad page goes back to the network
+                filter_fn=_is_json_response
+            )
+        else:
+            session = requests.Session()
+            
+        # Retries are handled (with backoff) by _call_api, not inside urllib3
+        session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=Retry(total=0)))
+        return session
+        
+    def _reset_session(self, failed_session):
+        """
+        Replace a session whose connections stalled with a fresh one.
+        
+        Args:
+            failed_session (requests.Session): The session the failed request used
+        """
+        with self._session_lock:
+            # Another thread may already have replaced it after the same stall
+            if self.session is not failed_session:
+                return
+            self.session = self._create_session()
+            NBAStatsHTTP._session = self.session
+            
+        logger.info("Reset HTTP session after a stalled request")
+        failed_session.close()
+        
+    def _get_viz_axes(self):
+        """
+        Get the shared comparison figure, cleared for a new plot.
+        
+        Returns:
+            tuple: (matplotlib.figure.Figure, matplotlib.axes.Axes)
+        """
+        if self._viz_fig is None:
+            # Built without pyplot, so it doesn't depend on the GUI backend and can be
+            # drawn from worker threads (callers hold _viz_lock)
+            self._viz_fig = Figure(figsize=(12, 6))
+            self._viz_ax = self._viz_fig.subplots()
+        else:
+            self._viz_ax.clear()
+        return self._viz_fig, self._viz_ax
+        
+    def _cache_path(self, key):
+        """Map a cache key to its file in the cache directory."""
+        file_name = key.replace(':', '_').replace(' ', '_')
+        return os.path.join(self.cache_dir, f"{file_name}.pkl")
+        
+    def _cache_get(self, key):
+        """
+        Load a cached API response from disk.
+        
+        Args:
+            key (str): Cache key identifying the request
+            
+        Returns:
+            The cached object, or None if it is missing or expired
+        """
+        file_path = self._cache_path(key)
+        if not os.path.exists(file_path):
+            return None
+            
+        try:
+            with open(file_path, 'rb') as f:
+                entry = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Failed to read cache entry {key}: {str(e)}")
+            return None
+            
+        # Entries from before the season state was recorded can't be trusted to be final
+        if not isinstance(entry, dict) or 'season_complete' not in entry:
+            return None
+            
+        # Whether an entry is permanent depends on when it was written: data fetched while
+        # the season was in progress keeps expiring even after the season has ended
+        if not entry['season_complete'] and time.time() - os.path.getmtime(file_path) > self.in_progress_ttl:
+            logger.debug(f"Cache entry {key} has expired")
+            return None
             
-        # Track requests to avoid hitting rate limits
-        self.last_request_time = datetime.now()
-        self.request_delay = 1  # seconds between requests
+        return entry['value']
             
-    def _rate_limit_request(self):
-        """Apply rate limiting to avoid getting blocked by the API."""
-        current_time = datetime.now()
-        elapsed = (current_time - self.last_request_time).total_seconds()
+    def _cache_set(self, key, value):
+        """
+        Store an API response on disk.
         
-        if elapsed < self.request_delay:
-            sleep_time = self.request_delay - elapsed
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-            time.sleep(sleep_time)
+        Args:
+            key (str): Cache key identifying the request
+            value: Object to cache (must be picklable)
+        """
+        file_path = self._cache_path(key)
+        tmp_path = None
+        try:
+            # Write to a temporary file first so a crash never leaves a truncated entry
+            # (one per writer, so threads storing the same key can't interleave)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                entry = {'season_complete': self.season_complete, 'value': value}
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, file_path)
+        except Exception as e:
+            logger.warning(f"Failed to write cache entry {key}: {str(e)}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            
+    def _save_dataframe(self, df, file_stem):
+        """
+        Save a DataFrame in the configured file format.
+        
+        Args:
+            df (pandas.DataFrame): Data to save
+            file_stem (str): Output path without the file extension
+            
+        Returns:
+            str: Path of the written file, or None if saving failed
+        """
+        # A failed save is logged but never discards data that was already fetched
+        try:
+            if self.save_format == "csv":
+                file_path = f"{file_stem}.csv"
+                df.to_csv(file_path, index=False)
+            else:
+                file_path = f"{file_stem}.parquet"
+                df.to_parquet(file_path, engine='pyarrow', compression='zstd', index=False)
+        except Exception as e:
+            logger.warning(f"Failed to save {file_stem}: {str(e)}")
+            return None
             
-        self.last_request_time = datetime.now()
+        return file_path
+        
+    def _call_api(self, endpoint, **params):
+        """
+        Call an nba_api endpoint under the rate limiter, retrying transient failures.
         
+        Args:
+            endpoint: nba_api endpoint class (e.g., playergamelog.PlayerGameLog)
+            **params: Parameters passed to the endpoint
+            
+        Returns:
+            The endpoint instance holding the response
+        """
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire()
+            session = self.session
+            try:
+                return endpoint(**params)
+            except RETRYABLE_ERRORS as e:
+                if attempt == self.max_retries:
+                    raise
+                    
+                # A stalled connection can stay stuck in the pool, so retry on fresh connections
+                if not isinstance(e, json.JSONDecodeError):
+                    self._reset_session(session)
+                    
+                # Exponential backoff with jitter so parallel workers don't retry in lockstep
+                delay = self.retry_backoff * 2 ** attempt + random.uniform(0, 1)
+                logger.warning(f"{endpoint.__name__} request failed ({str(e)}), retrying in {delay:.1f} seconds")
+                time.sleep(delay)
+                
     def get_player_id_by_name(self, player_name):
         """
         Get a player's ID by their name.
         
         Args:
-            player_name (str): Full or partial name of the player
+            player_name (str or int): Full or partial name of the player, or the player's ID
             
         Returns:
             int: Player ID if found, None otherwise
         """
         try:
-            # Search for player by name
-            player_matches = players.find_players_by_full_name(player_name)
-            
+            # IDs passed straight through only need to be validated, not searched for
+            player_id = _parse_id(player_name)
+            if player_id is not None:
+                if player_id in self.player_id_to_info:
+                    return player_id
+                logger.error(f"No player found with ID {player_id}")
+                return None
+                
+            # Exact full names resolve with a dict lookup; anything else falls back
+            # to the (partial-match) name search
+            player_matches = self.players_by_name.get(_normalize_name(player_name))
             if not player_matches:
-                # Try partial name search if full name search fails
-                player_matches = players.find_players_by_first_name(player_name.split()[0])
-                if not player_matches and len(player_name.split()) > 1:
-                    player_matches = players.find_players_by_last_name(player_name.split()[-1])
+                player_matches = _find_player_matches(player_name.lower())
             
             if player_matches:
                 if len(player_matches) > 1:
@@ -130,25 +617,28 @@ class NBADataScraper:
         Get a team's ID by their name.
         
         Args:
-            team_name (str): Full or partial name of the team
+            team_name (str or int): Full or partial name of the team, or the team's ID
             
         Returns:
             int: Team ID if found, None otherwise
         """
         try:
-            # Search for team by full name or abbreviation
-            team_matches = teams.find_teams_by_full_name(team_name)
-            
-            if not team_matches:
-                # Try abbreviation search
-                team_matches = teams.find_teams_by_abbreviation(team_name)
+            # IDs passed straight through only need to be validated, not searched for
+            team_id = _parse_id(team_name)
+            if team_id is not None:
+                if team_id in self.team_id_to_abbr.index:
+                    return team_id
+                logger.error(f"No team found with ID {team_id}")
+                return None
                 
-            if not team_matches:
-                # Try nickname search
-                team_matches = teams.find_teams_by_nickname(team_name)
+            # Exact full names, abbreviations and nicknames resolve with a dict lookup;
+            # anything else falls back to the (partial-match) name search
+            team_id = self.teams_by_name.get(_normalize_name(team_name))
+            if team_id is None:
+                team_matches = _find_team_matches(team_name.lower())
+                team_id = team_matches[0]['id'] if team_matches else None
                 
-            if team_matches:
-                team_id = team_matches[0]['id']
+            if team_id is not None:
                 logger.info(f"Found team ID {team_id} for '{team_name}'")
                 return team_id
             else:
@@ -159,120 +649,189 @@ class NBADataScraper:
             logger.error(f"Error finding team ID for '{team_name}': {str(e)}")
             return None
             
-    def get_player_game_log(self, player_id, save=True):
+    def _prepare_player_game_log(self, df, player_id):
+        """
+        Parse, enrich and compact a raw player game log.
+        
+        Args:
+            df (pandas.DataFrame): Game log as returned by the API
+            player_id (int): The player's ID
+            
+        Returns:
+            pandas.DataFrame: The processed game log
+        """
+        # Parse dates ("OCT 22, 2024") once so every later use sorts and plots on
+        # datetime64 instead of re-parsing strings
+        df['GAME_DATE'] = pd.to_datetime(df['GAME_DATE'], format='%b %d, %Y', cache=True)
+        
+        # Add a player_id column for reference
+        df['PLAYER_ID'] = player_id
+        
+        # Calculate additional stats that might be useful for ML
+        # (count the categories in double figures in one pass, then threshold it)
+        double_digit_cats = (df[['PTS', 'REB', 'AST', 'STL', 'BLK']].to_numpy() >= 10).sum(axis=1, dtype=np.int8)
+        df['DOUBLE_DOUBLE'] = (double_digit_cats >= 2).astype(np.int8)
+        df['TRIPLE_DOUBLE'] = (double_digit_cats >= 3).astype(np.int8)
+        
+        # Calculate shooting percentages where not already provided
+        if 'FG_PCT' not in df.columns and 'FGM' in df.columns and 'FGA' in df.columns:
+            df['FG_PCT'] = df['FGM'] / df['FGA']
+            
+        if 'FG3_PCT' not in df.columns and 'FG3M' in df.columns and 'FG3A' in df.columns:
+            df['FG3_PCT'] = df['FG3M'] / df['FG3A']
+            
+        _downcast(df)
+        
+        # Low-cardinality strings are stored as categoricals (integer codes + one copy of each value)
+        for col in CATEGORICAL_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+                
+        return df
+        
+    def get_player_game_log(self, player_id, save=True, use_cache=False):
         """
         Get game-by-game statistics for a player.
         
         Args:
             player_id (int): The player's ID
-            save (bool): Whether to save the data to a CSV file
+            save (bool): Whether to save the data to disk
+            use_cache (bool): Whether to reuse a game log already fetched by this scraper
             
         Returns:
             pandas.DataFrame: DataFrame containing player's game log
         """
         try:
             logger.info(f"Fetching game log for player ID {player_id} for season {self.season}")
-            self._rate_limit_request()
-            
-            # Get the player game log
-            player_game_log = playergamelog.PlayerGameLog(
-                player_id=player_id,
-                season=self.season,
-                season_type_all_star=self.season_type
-            )
+            cache_key = f"player_games:v{GAME_LOG_CACHE_VERSION}:{player_id}:{self.season}:{self.season_type}"
             
-            # Convert to DataFrame
-            df = player_game_log.get_data_frames()[0]
+            if use_cache and player_id in self._player_log_cache:
+                logger.info(f"Using game log for player ID {player_id} fetched earlier this session")
+                df = self._player_log_cache[player_id].copy()
+            else:
+                df = self._cache_get(cache_key)
+                if df is not None:
+                    logger.info(f"Loaded game log for player ID {player_id} from cache")
+            
+            if df is None:
+                # Get the player game log
+                player_game_log = self._call_api(
+                    playergamelog.PlayerGameLog,
+                    player_id=player_id,
+                    season=self.season,
+                    season_type_all_star=self.season_type
+                )
+                
+                # Convert to DataFrame and cache it fully processed, so warm runs skip
+                # date parsing, derived stats and dtype conversion as well as the request
+                df = player_game_log.get_data_frames()[0]
+                # Empty logs are not cached, so games played later are picked up
+                if not df.empty:
+                    df = self._prepare_player_game_log(df, player_id)
+                    self._cache_set(cache_key, df)
             
             if df.empty:
                 logger.warning(f"No game data found for player ID {player_id} in {self.season} season")
                 return pd.DataFrame()
-                
-            # Add a player_id column for reference
-            df['PLAYER_ID'] = player_id
             
             # Get player name for reference
-            try:
-                player_info = players.find_player_by_id(player_id)
-                player_name = player_info['full_name'] if player_info else f"Unknown_{player_id}"
-            except:
-                player_name = f"Unknown_{player_id}"
-                
-            # Calculate additional stats that might be useful for ML
-            df['DOUBLE_DOUBLE'] = ((df['PTS'] >= 10).astype(int) + 
-                                  (df['REB'] >= 10).astype(int) + 
-                                  (df['AST'] >= 10).astype(int) + 
-                                  (df['STL'] >= 10).astype(int) + 
-                                  (df['BLK'] >= 10).astype(int) >= 2).astype(int)
-            
-            df['TRIPLE_DOUBLE'] = ((df['PTS'] >= 10).astype(int) + 
-                                  (df['REB'] >= 10).astype(int) + 
-                                  (df['AST'] >= 10).astype(int) + 
-                                  (df['STL'] >= 10).astype(int) + 
-                                  (df['BLK'] >= 10).astype(int) >= 3).astype(int)
-            
-            # Calculate shooting percentages where not already provided
-            if 'FG_PCT' not in df.columns and 'FGM' in df.columns and 'FGA' in df.columns:
-                df['FG_PCT'] = df['FGM'] / df['FGA']
-                
-            if 'FG3_PCT' not in df.columns and 'FG3M' in df.columns and 'FG3A' in df.columns:
-                df['FG3_PCT'] = df['FG3M'] / df['FG3A']
-                
-            # Save to CSV if requested
+            player_info = self.player_id_to_info.get(player_id)
+            player_name = player_info['full_name'] if player_info else f"Unknown_{player_id}"
+                
+            # Save to disk if requested
             if save:
-                file_path = os.path.join(self.player_data_dir, f"{player_name.replace(' ', '_')}_games.csv")
-                df.to_csv(file_path, index=False)
-                logger.info(f"Saved player game log to {file_path}")
+                file_path = self._save_dataframe(df, os.path.join(self.player_data_dir, f"{player_name.replace(' ', '_')}_games"))
+                if file_path:
+                    logger.info(f"Saved player game log to {file_path}")
                 
             logger.info(f"Successfully fetched {len(df)} games for player ID {player_id}")
+            self._player_log_cache[player_id] = df.copy()
             return df
             
         except Exception as e:
             logger.error(f"Error fetching game log for player ID {player_id}: {str(e)}")
             return pd.DataFrame()
             
-    def get_team_game_log(self, team_id, save=True):
+    def _prepare_team_game_log(self, df, team_id):
+        """
+        Parse and compact a raw team game log.
+        
+        Args:
+            df (pandas.DataFrame): Game log as returned by the API
+            team_id (int): The team's ID
+            
+        Returns:
+            pandas.DataFrame: The processed game log
+        """
+        df['GAME_DATE'] = pd.to_datetime(df['GAME_DATE'], format='%b %d, %Y', cache=True)
+        
+        # Add a team_id column for reference
+        df['TEAM_ID'] = team_id
+        
+        _downcast(df)
+        
+        # Low-cardinality strings are stored as categoricals
+        for col in CATEGORICAL_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+                
+        return df
+        
+    def get_team_game_log(self, team_id, save=True, use_cache=False):
         """
         Get game-by-game statistics for a team.
         
         Args:
             team_id (int): The team's ID
-            save (bool): Whether to save the data to a CSV file
+            save (bool): Whether to save the data to disk
+            use_cache (bool): Whether to reuse a game log already fetched by this scraper
             
         Returns:
             pandas.DataFrame: DataFrame containing team's game log
         """
         try:
             logger.info(f"Fetching game log for team ID {team_id} for season {self.season}")
-            self._rate_limit_request()
+            cache_key = f"team_games:v{GAME_LOG_CACHE_VERSION}:{team_id}:{self.season}:{self.season_type}"
             
-            # Get the team game log
-            team_game_log = teamgamelog.TeamGameLog(
-                team_id=team_id,
-                season=self.season,
-                season_type_all_star=self.season_type
-            )
-            
-            # Convert to DataFrame
-            df = team_game_log.get_data_frames()[0]
+            if use_cache and team_id in self._team_log_cache:
+                logger.info(f"Using game log for team ID {team_id} fetched earlier this session")
+                df = self._team_log_cache[team_id].copy()
+            else:
+                df = self._cache_get(cache_key)
+                if df is not None:
+                    logger.info(f"Loaded game log for team ID {team_id} from cache")
+            
+            if df is None:
+                # Get the team game log
+                team_game_log = self._call_api(
+                    teamgamelog.TeamGameLog,
+                    team_id=team_id,
+                    season=self.season,
+                    season_type_all_star=self.season_type
+                )
+                
+                # Convert to DataFrame and cache it fully processed
+                df = team_game_log.get_data_frames()[0]
+                # Empty logs are not cached, so games played later are picked up
+                if not df.empty:
+                    df = self._prepare_team_game_log(df, team_id)
+                    self._cache_set(cache_key, df)
             
             if df.empty:
                 logger.warning(f"No game data found for team ID {team_id} in {self.season} season")
                 return pd.DataFrame()
             
-            # Add a team_id column for reference
-            df['TEAM_ID'] = team_id
-            
             # Get team abbreviation for reference
             team_abbr = self.team_id_to_abbr.get(team_id, f"Unknown_{team_id}")
                 
-            # Save to CSV if requested
+            # Save to disk if requested
             if save:
-                file_path = os.path.join(self.team_data_dir, f"{team_abbr}_games.csv")
-                df.to_csv(file_path, index=False)
-                logger.info(f"Saved team game log to {file_path}")
+                file_path = self._save_dataframe(df, os.path.join(self.team_data_dir, f"{team_abbr}_games"))
+                if file_path:
+                    logger.info(f"Saved team game log to {file_path}")
                 
             logger.info(f"Successfully fetched {len(df)} games for team ID {team_id}")
+            self._team_log_cache[team_id] = df.copy()
             return df
             
         except Exception as e:
@@ -285,36 +844,47 @@ class NBADataScraper:
         
         Args:
             game_id (str): The ID of the game
-            save (bool): Whether to save the data to a CSV file
+            save (bool): Whether to save the data to disk
             
         Returns:
             dict: Dictionary containing player and team box scores
         """
         try:
             logger.info(f"Fetching box score for game ID {game_id}")
-            self._rate_limit_request()
-            
-            # Get the box score
-            box_score = boxscoretraditionalv2.BoxScoreTraditionalV2(game_id=game_id)
+            cache_key = f"boxscore:{game_id}"
+            cached = self._cache_get(cache_key)
             
-            # Get data frames
-            player_stats = box_score.player_stats.get_data_frame()
-            team_stats = box_score.team_stats.get_data_frame()
+            if cached is None:
+                # Get the box score
+                box_score = self._call_api(boxscoretraditionalv2.BoxScoreTraditionalV2, game_id=game_id)
+                
+                # Build data frames straight from the raw result sets, skipping the
+                # per-dataset dict copies that get_data_frame() makes
+                result_sets = {rs['name']: rs for rs in box_score.get_dict()['resultSets']}
+                player_stats = pd.DataFrame.from_records(result_sets['PlayerStats']['rowSet'],
+                                                         columns=result_sets['PlayerStats']['headers'])
+                team_stats = pd.DataFrame.from_records(result_sets['TeamStats']['rowSet'],
+                                                       columns=result_sets['TeamStats']['headers'])
+                if not player_stats.empty and not team_stats.empty:
+                    self._cache_set(cache_key, {'player_stats': player_stats, 'team_stats': team_stats})
+            else:
+                logger.info(f"Loaded box score for game ID {game_id} from cache")
+                player_stats = cached['player_stats']
+                team_stats = cached['team_stats']
             
             if player_stats.empty or team_stats.empty:
                 logger.warning(f"No box score data found for game ID {game_id}")
                 return {'player_stats': pd.DataFrame(), 'team_stats': pd.DataFrame()}
                 
-            # Save to CSV if requested
+            # Save to disk if requested
             if save:
-                player_file_path = os.path.join(self.boxscore_data_dir, f"game_{game_id}_player_stats.csv")
-                team_file_path = os.path.join(self.boxscore_data_dir, f"game_{game_id}_team_stats.csv")
-                
-                player_stats.to_csv(player_file_path, index=False)
-                team_stats.to_csv(team_file_path, index=False)
+                player_file_path = self._save_dataframe(player_stats, os.path.join(self.boxscore_data_dir, f"game_{game_id}_player_stats"))
+                team_file_path = self._save_dataframe(team_stats, os.path.join(self.boxscore_data_dir, f"game_{game_id}_team_stats"))
                 
-                logger.info(f"Saved player box score to {player_file_path}")
-                logger.info(f"Saved team box score to {team_file_path}")
+                if player_file_path:
+                    logger.info(f"Saved player box score to {player_file_path}")
+                if team_file_path:
+                    logger.info(f"Saved team box score to {team_file_path}")
                 
             logger.info(f"Successfully fetched box score for game ID {game_id}")
             return {'player_stats': player_stats, 'team_stats': team_stats}
@@ -323,37 +893,93 @@ class NBADataScraper:
             logger.error(f"Error fetching box score for game ID {game_id}: {str(e)}")
             return {'player_stats': pd.DataFrame(), 'team_stats': pd.DataFrame()}
             
-    def get_recent_games_for_all_teams(self, days_back=30):
+    def get_recent_games_for_all_teams(self, days_back=30, max_workers=4):
         """
         Get recent games for all teams.
         
+        Requests are issued from a small thread pool so several are in flight
+        at once; the shared rate limiter still paces how often they start.
+        
         Args:
             days_back (int): Number of days to look back for games
+            max_workers (int): Maximum number of concurrent requests
             
         Returns:
             dict: Dictionary mapping team IDs to their game data
         """
         result = {}
         
-        for team in self.teams_data:
-            team_id = team['id']
-            team_name = team['full_name']
-            
-            logger.info(f"Fetching recent games for {team_name} (ID: {team_id})")
-            
-            try:
-                df = self.get_team_game_log(team_id)
-                if not df.empty:
-                    result[team_id] = df
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for team in self.teams_data:
+                logger.info(f"Fetching recent games for {team['full_name']} (ID: {team['id']})")
+                futures[executor.submit(self.get_team_game_log, team['id'])] = team
                 
-                # Avoid hitting rate limits
-                time.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"Error fetching games for {team_name}: {str(e)}")
+            for future in as_completed(futures):
+                team = futures[future]
+                try:
+                    df = future.result()
+                    if not df.empty:
+                        result[team['id']] = df
+                        
+                except Exception as e:
+                    logger.error(f"Error fetching games for {team['full_name']}: {str(e)}")
                 
         return result
     
+    async def aget_player_game_log(self, player_id, save=True):
+        """
+        Async version of get_player_game_log.
+        
+        The request (and the file write) runs on a worker thread, so the event
+        loop keeps driving other requests while this one waits on the network.
+        
+        Args:
+            player_id (int): The player's ID
+            save (bool): Whether to save the data to disk
+            
+        Returns:
+            pandas.DataFrame: DataFrame containing player's game log
+        """
+        return await asyncio.to_thread(self.get_player_game_log, player_id, save)
+        
+    async def aget_team_game_log(self, team_id, save=True):
+        """
+        Async version of get_team_game_log.
+        
+        Args:
+            team_id (int): The team's ID
+            save (bool): Whether to save the data to disk
+            
+        Returns:
+            pandas.DataFrame: DataFrame containing team's game log
+        """
+        return await asyncio.to_thread(self.get_team_game_log, team_id, save)
+        
+    async def scrape_many_players(self, player_ids, max_concurrency=4, save=True):
+        """
+        Fetch game logs for many players concurrently.
+        
+        At most max_concurrency requests are in flight at once; the shared rate
+        limiter still paces how often they start.
+        
+        Args:
+            player_ids (list): IDs of the players to fetch
+            max_concurrency (int): Maximum number of concurrent requests
+            save (bool): Whether to save the data to disk
+            
+        Returns:
+            dict: Dictionary mapping player IDs to their game data
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def fetch(player_id):
+            async with semaphore:
+                return await self.aget_player_game_log(player_id, save)
+                
+        game_logs = await asyncio.gather(*(fetch(player_id) for player_id in player_ids))
+        return {player_id: df for player_id, df in zip(player_ids, game_logs) if not df.empty}
+    
     def visualize_player_comparison(self, player1_name, player2_name, stat_column):
         """
         Create a visualization comparing two players' statistics.
@@ -364,7 +990,7 @@ class NBADataScraper:
             stat_column (str): The statistic to compare (e.g., 'PTS', 'AST')
             
         Returns:
-            matplotlib.figure.Figure: The generated figure
+            matplotlib.figure.Figure: The generated figure (shared, and redrawn by the next comparison)
         """
         try:
             # Get player IDs
@@ -379,8 +1005,8 @@ class NBADataScraper:
                 return None
                 
             # Get player data
-            player1_data = self.get_player_game_log(player1_id)
-            player2_data = self.get_player_game_log(player2_id)
+            player1_data = self.get_player_game_log(player1_id, use_cache=True)
+            player2_data = self.get_player_game_log(player2_id, use_cache=True)
             
             if player1_data.empty or player2_data.empty:
                 if player1_data.empty:
@@ -396,56 +1022,57 @@ class NBADataScraper:
                 logger.info(f"Available statistics: {available_stats}")
                 return None
                 
-            # Create figure and axis
-            fig, ax = plt.subplots(figsize=(12, 6))
-            
-            # Sort by date
-            player1_data = player1_data.sort_values('GAME_DATE')
-            player2_data = player2_data.sort_values('GAME_DATE')
-            
-            # Plot data
-            ax.plot(range(len(player1_data)), player1_data[stat_column], 'b-', label=player1_name)
-            ax.plot(range(len(player2_data)), player2_data[stat_column], 'r-', label=player2_name)
-            
-            # Add rolling average (last 5 games)
-            window = min(5, len(player1_data), len(player2_data))
-            if window > 1:
-                player1_rolling = player1_data[stat_column].rolling(window=window).mean()
-                player2_rolling = player2_data[stat_column].rolling(window=window).mean()
+            with self._viz_lock:
+                # Reuse the shared figure and axis
+                fig, ax = self._get_viz_axes()
                 
-                ax.plot(range(len(player1_data)), player1_rolling, 'b--', alpha=0.7, 
-                        label=f"{player1_name} (5-game avg)")
-                ax.plot(range(len(player2_data)), player2_rolling, 'r--', alpha=0.7,
-                        label=f"{player2_name} (5-game avg)")
-            
-            # Add labels and title
-            ax.set_xlabel('Game Number')
-            ax.set_ylabel(stat_column)
-            ax.set_title(f'{stat_column} Comparison: {player1_name} vs {player2_name}')
-            ax.legend()
-            ax.grid(True, alpha=0.3)
-            
-            # Add season average line
-            player1_avg = player1_data[stat_column].mean()
-            player2_avg = player2_data[stat_column].mean()
-            
-            ax.axhline(y=player1_avg, color='b', linestyle=':', alpha=0.5,
-                       label=f"{player1_name} Avg: {player1_avg:.1f}")
-            ax.axhline(y=player2_avg, color='r', linestyle=':', alpha=0.5,
-                       label=f"{player2_name} Avg: {player2_avg:.1f}")
-            
-            ax.legend()
-            
-            # Save figure
-            output_dir = os.path.join(self.data_dir, "visualizations")
-            if not os.path.exists(output_dir):
-                os.makedirs(output_dir)
+                # Sort by date
+                player1_data = player1_data.sort_values('GAME_DATE')
+                player2_data = player2_data.sort_values('GAME_DATE')
                 
-            file_path = os.path.join(output_dir, f"{player1_name.replace(' ', '_')}_vs_{player2_name.replace(' ', '_')}_{stat_column}.png")
-            plt.savefig(file_path)
-            logger.info(f"Saved visualization to {file_path}")
-            
-            return fig
+                # Plot data
+                ax.plot(range(len(player1_data)), player1_data[stat_column], 'b-', label=player1_name)
+                ax.plot(range(len(player2_data)), player2_data[stat_column], 'r-', label=player2_name)
+                
+                # Add rolling average (last 5 games)
+                window = min(5, len(player1_data), len(player2_data))
+                if window > 1:
+                    player1_rolling = _rolling_mean(player1_data[stat_column], window)
+                    player2_rolling = _rolling_mean(player2_data[stat_column], window)
+                    
+                    ax.plot(range(len(player1_data)), player1_rolling, 'b--', alpha=0.7, 
+                            label=f"{player1_name} (5-game avg)")
+                    ax.plot(range(len(player2_data)), player2_rolling, 'r--', alpha=0.7,
+                            label=f"{player2_name} (5-game avg)")
+                
+                # Add labels and title
+                ax.set_xlabel('Game Number')
+                ax.set_ylabel(stat_column)
+                ax.set_title(f'{stat_column} Comparison: {player1_name} vs {player2_name}')
+                ax.legend()
+                ax.grid(True, alpha=0.3)
+                
+                # Add season average line
+                player1_avg = player1_data[stat_column].mean()
+                player2_avg = player2_data[stat_column].mean()
+                
+                ax.axhline(y=player1_avg, color='b', linestyle=':', alpha=0.5,
+                           label=f"{player1_name} Avg: {player1_avg:.1f}")
+                ax.axhline(y=player2_avg, color='r', linestyle=':', alpha=0.5,
+                           label=f"{player2_name} Avg: {player2_avg:.1f}")
+                
+                ax.legend()
+                
+                # Save figure
+                output_dir = os.path.join(self.data_dir, "visualizations")
+                if not os.path.exists(output_dir):
+                    os.makedirs(output_dir)
+                    
+                file_path = os.path.join(output_dir, f"{player1_name.replace(' ', '_')}_vs_{player2_name.replace(' ', '_')}_{stat_column}.png")
+                fig.savefig(file_path)
+                logger.info(f"Saved visualization to {file_path}")
+                
+                return fig
             
         except Exception as e:
             logger.error(f"Error creating visualization: {str(e)}")
@@ -461,7 +1088,7 @@ class NBADataScraper:
             stat_column (str): The statistic to compare (e.g., 'PTS', 'AST', 'REB')
             
         Returns:
-            matplotlib.figure.Figure: The generated figure
+            matplotlib.figure.Figure: The generated figure (shared, and redrawn by the next comparison)
         """
         try:
             # Get team IDs
@@ -476,8 +1103,8 @@ class NBADataScraper:
                 return None
                 
             # Get team data
-            team1_data = self.get_team_game_log(team1_id)
-            team2_data = self.get_team_game_log(team2_id)
+            team1_data = self.get_team_game_log(team1_id, use_cache=True)
+            team2_data = self.get_team_game_log(team2_id, use_cache=True)
             
             if team1_data.empty or team2_data.empty:
                 if team1_data.empty:
@@ -493,56 +1120,57 @@ class NBADataScraper:
                 logger.info(f"Available statistics: {available_stats}")
                 return None
                 
-            # Create figure and axis
-            fig, ax = plt.subplots(figsize=(12, 6))
-            
-            # Sort by date
-            team1_data = team1_data.sort_values('GAME_DATE')
-            team2_data = team2_data.sort_values('GAME_DATE')
-            
-            # Plot data
-            ax.plot(range(len(team1_data)), team1_data[stat_column], 'b-', label=team1_name)
-            ax.plot(range(len(team2_data)), team2_data[stat_column], 'r-', label=team2_name)
-            
-            # Add rolling average (last 5 games)
-            window = min(5, len(team1_data), len(team2_data))
-            if window > 1:
-                team1_rolling = team1_data[stat_column].rolling(window=window).mean()
-                team2_rolling = team2_data[stat_column].rolling(window=window).mean()
+            with self._viz_lock:
+                # Reuse the shared figure and axis
+                fig, ax = self._get_viz_axes()
                 
-                ax.plot(range(len(team1_data)), team1_rolling, 'b--', alpha=0.7, 
-                        label=f"{team1_name} (5-game avg)")
-                ax.plot(range(len(team2_data)), team2_rolling, 'r--', alpha=0.7,
-                        label=f"{team2_name} (5-game avg)")
-            
-            # Add labels and title
-            ax.set_xlabel('Game Number')
-            ax.set_ylabel(stat_column)
-            ax.set_title(f'Team {stat_column} Comparison: {team1_name} vs {team2_name}')
-            ax.legend()
-            ax.grid(True, alpha=0.3)
-            
-            # Add season average line
-            team1_avg = team1_data[stat_column].mean()
-            team2_avg = team2_data[stat_column].mean()
-            
-            ax.axhline(y=team1_avg, color='b', linestyle=':', alpha=0.5,
-                       label=f"{team1_name} Avg: {team1_avg:.1f}")
-            ax.axhline(y=team2_avg, color='r', linestyle=':', alpha=0.5,
-                       label=f"{team2_name} Avg: {team2_avg:.1f}")
-            
-            ax.legend()
-            
-            # Save figure
-            output_dir = os.path.join(self.data_dir, "visualizations")
-            if not os.path.exists(output_dir):
-                os.makedirs(output_dir)
+                # Sort by date
+                team1_data = team1_data.sort_values('GAME_DATE')
+                team2_data = team2_data.sort_values('GAME_DATE')
                 
-            file_path = os.path.join(output_dir, f"{team1_name.replace(' ', '_')}_vs_{team2_name.replace(' ', '_')}_{stat_column}.png")
-            plt.savefig(file_path)
-            logger.info(f"Saved visualization to {file_path}")
-            
-            return fig
+                # Plot data
+                ax.plot(range(len(team1_data)), team1_data[stat_column], 'b-', label=team1_name)
+                ax.plot(range(len(team2_data)), team2_data[stat_column], 'r-', label=team2_name)
+                
+                # Add rolling average (last 5 games)
+                window = min(5, len(team1_data), len(team2_data))
+                if window > 1:
+                    team1_rolling = _rolling_mean(team1_data[stat_column], window)
+                    team2_rolling = _rolling_mean(team2_data[stat_column], window)
+                    
+                    ax.plot(range(len(team1_data)), team1_rolling, 'b--', alpha=0.7, 
+                            label=f"{team1_name} (5-game avg)")
+                    ax.plot(range(len(team2_data)), team2_rolling, 'r--', alpha=0.7,
+                            label=f"{team2_name} (5-game avg)")
+                
+                # Add labels and title
+                ax.set_xlabel('Game Number')
+                ax.set_ylabel(stat_column)
+                ax.set_title(f'Team {stat_column} Comparison: {team1_name} vs {team2_name}')
+                ax.legend()
+                ax.grid(True, alpha=0.3)
+                
+                # Add season average line
+                team1_avg = team1_data[stat_column].mean()
+                team2_avg = team2_data[stat_column].mean()
+                
+                ax.axhline(y=team1_avg, color='b', linestyle=':', alpha=0.5,
+                           label=f"{team1_name} Avg: {team1_avg:.1f}")
+                ax.axhline(y=team2_avg, color='r', linestyle=':', alpha=0.5,
+                           label=f"{team2_name} Avg: {team2_avg:.1f}")
+                
+                ax.legend()
+                
+                # Save figure
+                output_dir = os.path.join(self.data_dir, "visualizations")
+                if not os.path.exists(output_dir):
+                    os.makedirs(output_dir)
+                    
+                file_path = os.path.join(output_dir, f"{team1_name.replace(' ', '_')}_vs_{team2_name.replace(' ', '_')}_{stat_column}.png")
+                fig.savefig(file_path)
+                logger.info(f"Saved visualization to {file_path}")
+                
+                return fig
             
         except Exception as e:
             logger.error(f"Error creating visualization: {str(e)}")
@@ -569,14 +1197,16 @@ class NBADataScraper:
                 team_stats = box_score['team_stats']
                 
                 # Check if the sum of player points equals team points
-                home_team_id = team_stats['TEAM_ID'].iloc[0]
-                away_team_id = team_stats['TEAM_ID'].iloc[1]
+                # (plain NumPy on these ~25-row frames avoids pandas indexer overhead)
+                team_ids = team_stats['TEAM_ID'].to_numpy()
+                team_pts = team_stats['PTS'].to_numpy(dtype=np.float64)
+                home_team_id, away_team_id = team_ids[0], team_ids[1]
+                home_team_pts, away_team_pts = team_pts[0], team_pts[1]
                 
-                home_team_pts = team_stats.loc[team_stats['TEAM_ID'] == home_team_id, 'PTS'].values[0]
-                away_team_pts = team_stats.loc[team_stats['TEAM_ID'] == away_team_id, 'PTS'].values[0]
-                
-                home_player_pts = player_stats.loc[player_stats['TEAM_ID'] == home_team_id, 'PTS'].sum()
-                away_player_pts = player_stats.loc[player_stats['TEAM_ID'] == away_team_id, 'PTS'].sum()
+                player_team_ids = player_stats['TEAM_ID'].to_numpy()
+                player_pts = player_stats['PTS'].to_numpy(dtype=np.float64)
+                home_player_pts = np.nansum(player_pts[player_team_ids == home_team_id])
+                away_player_pts = np.nansum(player_pts[player_team_ids == away_team_id])
                 
                 # Check if they match
                 home_check = abs(home_team_pts - home_player_pts) < 0.1
@@ -598,6 +1228,74 @@ class NBADataScraper:
             logger.error(f"Error during spot check for game ID {game_id}: {str(e)}")
             return False
         
+    def spot_check_many(self, game_ids):
+        """
+        Perform the spot check on several games at once.
+        
+        Player points from every box score are summed per (game, team) in a
+        single vectorized pass rather than with two pandas filters per game.
+        
+        Args:
+            game_ids (list): IDs of the games to check
+            
+        Returns:
+            dict: Mapping of game ID to True if its spot check passes, False otherwise
+        """
+        results = dict.fromkeys(game_ids, False)
+        
+        try:
+            checked_ids = []
+            player_frames = []
+            team_frames = []
+            
+            for game_id in game_ids:
+                box_score = self.get_box_score(game_id, save=False)
+                
+                if box_score['player_stats'].empty or box_score['team_stats'].empty:
+                    logger.warning(f"No data available for spot check on game ID {game_id}")
+                    continue
+                    
+                # Label rows with the game's position so game IDs of any type line up
+                game_idx = len(checked_ids)
+                checked_ids.append(game_id)
+                player_frames.append(box_score['player_stats'][['TEAM_ID', 'PTS']].assign(GAME_IDX=game_idx))
+                team_frames.append(box_score['team_stats'][['TEAM_ID', 'PTS']].assign(GAME_IDX=game_idx))
+                
+            if not checked_ids:
+                return results
+                
+            player_stats = pd.concat(player_frames, ignore_index=True)
+            team_stats = pd.concat(team_frames, ignore_index=True)
+            
+            # Map every player row to its (game, team) row in team_stats, then sum
+            # player points for all teams in one bincount
+            team_keys = pd.MultiIndex.from_arrays([team_stats['GAME_IDX'], team_stats['TEAM_ID']])
+            group_idx = team_keys.get_indexer(pd.MultiIndex.from_arrays([player_stats['GAME_IDX'], player_stats['TEAM_ID']]))
+            player_pts = np.nan_to_num(player_stats['PTS'].to_numpy(dtype=np.float64))
+            
+            matched = group_idx >= 0
+            calculated_pts = np.bincount(group_idx[matched], weights=player_pts[matched], minlength=len(team_stats))
+            reported_pts = team_stats['PTS'].to_numpy(dtype=np.float64)
+            team_checks = np.abs(reported_pts - calculated_pts) < 0.1
+            
+            game_idx = team_stats['GAME_IDX'].to_numpy()
+            for idx, game_id in enumerate(checked_ids):
+                rows = game_idx == idx
+                if team_checks[rows].all():
+                    results[game_id] = True
+                else:
+                    logger.warning(f"Spot check failed for game ID {game_id}")
+                    for team_id, reported, calculated in zip(team_stats['TEAM_ID'].to_numpy()[rows],
+                                                             reported_pts[rows], calculated_pts[rows]):
+                        logger.warning(f"Team {team_id}: reported {reported}, calculated {calculated}")
+                        
+            logger.info(f"Spot check passed for {sum(results.values())} of {len(game_ids)} games")
+            return results
+            
+        except Exception as e:
+            logger.error(f"Error during spot check of {len(game_ids)} games: {str(e)}")
+            return results
+        
     def predict_next_game_points(self, player_name, visualize=True):
         """
         Simple XGBoost example to predict a player's next game points.
@@ -718,83 +1416,267 @@ class NBADataScraper:
 
         
 
+class Pipeline:
+    """
+    Shared execution context for scraping work from several demos.
+    
+    Everything submitted runs on one bounded thread pool against one scraper,
+    so all of it shares the scraper's HTTP session, rate limiter and caches.
+    """
+    def __init__(self, scraper, max_workers=4):
+        """
+        Initialize the pipeline.
+        
+        Args:
+            scraper (NBADataScraper): Scraper whose methods are run
+            max_workers (int): Maximum number of calls running at once
+        """
+        self.scraper = scraper
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        
+    def submit(self, fn, *args):
+        """
+        Queue a blocking call on the pipeline's thread pool.
+        
+        Returns:
+            concurrent.futures.Future: Future for the call's result
+        """
+        return self.executor.submit(fn, *args)
+        
+    async def run(self, fn, *args):
+        """Run a blocking call on the pipeline's thread pool and await its result."""
+        return await asyncio.wrap_future(self.submit(fn, *args))
+        
+    def close(self):
+        """Wait for queued work to finish and shut the thread pool down."""
+        self.executor.shutdown(wait=True)
+        
+    def __enter__(self):
+        return self
+        
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        
+        
+async def prefetch_game_log(pipeline, resolve_id, fetch_game_log, name, known_ids):
+    """
+    Resolve a name and fetch its game log, warming the scraper's game-log memo.
+    
+    Args:
+        pipeline (Pipeline): Pipeline to run the requests on
+        resolve_id: Scraper method mapping a name to an ID (e.g., get_player_id_by_name)
+        fetch_game_log: Scraper method fetching a game log by ID (e.g., get_player_game_log)
+        name (str): Player or team name
+        known_ids (dict): Precomputed IDs to use instead of resolve_id when possible
+    """
+    entity_id = known_ids.get(name) or await pipeline.run(resolve_id, name)
+    if entity_id:
+        await pipeline.run(fetch_game_log, entity_id)
+        
+        
+async def demo_player(pipeline, player_name, another_player, stat_column="PTS"):
+    """
+    Fetch a player's game log and plot it against another player.
+    
+    Args:
+        pipeline (Pipeline): Shared pipeline to run the requests on
+        player_name (str): Name of the player to fetch
+        another_player (str): Name of the player to compare against
+        stat_column (str): The statistic to compare (e.g., 'PTS', 'AST')
+    """
+    scraper = pipeline.scraper
+    
+    # Fetch the comparison player in the background so the visualization finds it memoized
+    prefetch = None
+    if VISUALIZE:
+        prefetch = asyncio.create_task(
+            prefetch_game_log(pipeline, scraper.get_player_id_by_name, scraper.get_player_game_log, another_player, KNOWN_PLAYER_IDS)
+        )
+        
+    try:
+        player_id = KNOWN_PLAYER_IDS.get(player_name) or await pipeline.run(scraper.get_player_id_by_name, player_name)
+        if not player_id:
+            return
+            
+        logger.info("Getting game log for %s", player_name)
+        player_data = await pipeline.run(scraper.get_player_game_log, player_id)
+        
+        if player_data.empty:
+            logger.error("Failed to retrieve game data for %s", player_name)
+            return
+            
+        logger.info("Successfully retrieved %d games for %s", len(player_data), player_name)
+        # Only render the table if INFO messages are actually emitted
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Last 5 games:")
+            logger.info("%s", player_data.head().to_string())
+            
+        # Example visualization
+        if VISUALIZE:
+            logger.info("Creating visualization comparing %s and %s", player_name, another_player)
+            await prefetch
+            await pipeline.run(scraper.visualize_player_comparison, player_name, another_player, stat_column)
+            
+    finally:
+        # Wait for the prefetch without letting its error replace the one being raised
+        if prefetch is not None:
+            await asyncio.gather(prefetch, return_exceptions=True)
+        
+        
+async def demo_team(pipeline, team_name, another_team, stat_column="PTS"):
+    """
+    Fetch a team's game log, plot it against another team and spot check a game.
+    
+    Args:
+        pipeline (Pipeline): Shared pipeline to run the requests on
+        team_name (str): Name of the team to fetch
+        another_team (str): Name of the team to compare against
+        stat_column (str): The statistic to compare (e.g., 'PTS', 'AST', 'REB')
+    """
+    scraper = pipeline.scraper
+    
+    # Fetch the comparison team in the background so the visualization finds it memoized
+    prefetch = None
+    if VISUALIZE:
+        prefetch = asyncio.create_task(
+            prefetch_game_log(pipeline, scraper.get_team_id_by_name, scraper.get_team_game_log, another_team, KNOWN_TEAM_IDS)
+        )
+        
+    try:
+        team_id = KNOWN_TEAM_IDS.get(team_name) or await pipeline.run(scraper.get_team_id_by_name, team_name)
+        if not team_id:
+            return
+            
+        logger.info("Getting game log for %s", team_name)
+        team_data = await pipeline.run(scraper.get_team_game_log, team_id)
+        
+        if team_data.empty:
+            logger.error("Failed to retrieve game data for %s", team_name)
+            return
+            
+        logger.info("Successfully retrieved %d games for %s", len(team_data), team_name)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Last 5 games:")
+            logger.info("%s", team_data.head().to_string())
+            
+        steps = []
+        
+        # Example team visualization
+        if VISUALIZE:
+            logger.info("Creating visualization comparing %s and %s", team_name, another_team)
+            await prefetch
+            steps.append(pipeline.run(scraper.visualize_team_comparison, team_name, another_team, stat_column))
+            
+        # If we have game IDs, we can spot check a game while the comparison is being drawn
+        # (TeamGameLog names the column Game_ID, not GAME_ID as in box scores)
+        has_game_id = 'Game_ID' in team_data.columns
+        if has_game_id:
+            game_id = team_data.iat[0, team_data.columns.get_loc('Game_ID')]
+            logger.info("Performing spot check on game ID %s", game_id)
+            steps.append(pipeline.run(scraper.spot_check_game, game_id))
+            
+        results = await asyncio.gather(*steps)
+        if has_game_id:
+            logger.info("Spot check %s", 'passed' if results[-1] else 'failed')
+            
+    finally:
+        # Wait for the prefetch without letting its error replace the one being raised
+        if prefetch is not None:
+            await asyncio.gather(prefetch, return_exceptions=True)
+        
+        
+@dataclass
+class Case:
+    """Players, teams and statistics compared in one demo case."""
+    player_name: str
+    another_player: str
+    team_name: str
+    another_team: str
+    player_stat: str = "PTS"
+    team_stat: str = "PTS"
+
+
+CASES = [
+    Case("Luka Doncic", "Stephen Curry", "Los Angeles Lakers", "Oklahoma City Thunder"),
+    Case("Giannis Antetokounmpo", "Karl-Anthony Towns", "Orlando Magic", "Miami Heat", player_stat="AST"),
+]
+
+
+async def run_case(pipeline, case):
+    """
+    Run the player and team examples of one case.
+    
+    The two examples don't depend on each other, so they run as concurrent tasks.
+    
+    Args:
+        pipeline (Pipeline): Shared pipeline to run the requests on
+        case (Case): Players and teams to compare
+    """
+    player_task = asyncio.create_task(demo_player(pipeline, case.player_name, case.another_player, case.player_stat))
+    team_task = asyncio.create_task(demo_team(pipeline, case.team_name, case.another_team, case.team_stat))
+    
+    # Wait for both examples even if one fails, so neither is left running unobserved
+    results = await asyncio.gather(player_task, team_task, return_exceptions=True)
+    errors = [result for result in results if isinstance(result, BaseException)]
+    
+    # The caller reports the error raised below; log the other one here so it isn't lost
+    for error in errors[1:]:
+        logger.error("Another example in demo case %s also failed", case, exc_info=error)
+    if errors:
+        raise errors[0]
+
+
 # Example usage function
-def demo_usage():
+async def run_all(pipeline, cases=CASES):
     """
     Demonstrate how to use the NBADataScraper class.
+    
+    Scraper calls block on the network, so they run on the pipeline's worker
+    threads, and all cases are run together so their requests share one batch.
+    
+    Args:
+        pipeline (Pipeline): Shared pipeline, so every case uses one session,
+            rate limiter and set of caches
+        cases (list): Cases to run
     """
     try:
-        # Initialize the scraper
-        scraper = NBADataScraper(season="2024-25")
-        logger.info("NBA Data Scraper initialized successfully")
-        
-        # Get data for a specific player (e.g., Luka Doncic)
-        player_name = "Luka Doncic"
-        player_id = scraper.get_player_id_by_name(player_name)
-        
-        if player_id:
-            logger.info(f"Getting game log for {player_name}")
-            player_data = scraper.get_player_game_log(player_id)
-            
-            if not player_data.empty:
-                logger.info(f"Successfully retrieved {len(player_data)} games for {player_name}")
-                logger.info(f"Last 5 games:")
-                logger.info(player_data.head().to_string())
-                
-                # Example visualization
-                another_player = "Stephen Curry"
-                logger.info(f"Creating visualization comparing {player_name} and {another_player}")
-                scraper.visualize_player_comparison(player_name, another_player, "PTS")
-            else:
-                logger.error(f"Failed to retrieve game data for {player_name}")
-                
-        # Get data for a specific team (e.g., Los Angeles Lakers)
-        team_name = "Los Angeles Lakers"
-        team_id = scraper.get_team_id_by_name(team_name)
+        # Transient network errors are already retried (with backoff) inside the scraper, so
+        # anything reaching this point is a real failure; one failing case shouldn't abort the rest
+        results = await asyncio.gather(*(run_case(pipeline, case) for case in cases), return_exceptions=True)
         
-        if team_id:
-            logger.info(f"Getting game log for {team_name}")
-            team_data = scraper.get_team_game_log(team_id)
-            
-            if not team_data.empty:
-                logger.info(f"Successfully retrieved {len(team_data)} games for {team_name}")
-                logger.info(f"Last 5 games:")
-                logger.info(team_data.head().to_string())
+        failed = 0
+        for case, result in zip(cases, results):
+            if isinstance(result, Exception):
+                failed += 1
+                logger.error("Error in demo case %s", case, exc_info=result)
                 
-                # Example team visualization
-                another_team = "Oklahoma City Thunder"
-                logger.info(f"Creating visualization comparing {team_name} and {another_team}")
-                scraper.visualize_team_comparison(team_name, another_team, "PTS")
-            else:
-                logger.error(f"Failed to retrieve game data for {team_name}")
-                
-            # If we have game IDs, we can spot check a game
-            if not team_data.empty and 'GAME_ID' in team_data.columns:
-                game_id = team_data['GAME_ID'].iloc[0]
-                logger.info(f"Performing spot check on game ID {game_id}")
-                spot_check_result = scraper.spot_check_game(game_id)
-                logger.info(f"Spot check {'passed' if spot_check_result else 'failed'}")
-                
-        logger.info("Demo completed successfully")
+        if failed:
+            logger.error("Demo finished with %d failed case(s)", failed)
+        else:
+            logger.info("Demo completed successfully")
         
-    except Exception as e:
-        logger.error(f"Error in demo: {str(e)}")
+    except Exception:
+        logger.exception("Error in demo")
 
 
-## To compare different players, just update  player_name and another_player
-##  with their full proper names and same goes for team_name and another_team
+## To compare different players, just update (or add) a Case in CASES with the
+##  players' full proper names and same goes for team_name and another_team
 ## i.e. put in the full proper name ex: Karl-Anthony Towns is the proper name or Los Angeles Lakers
 ## Luka Doncic's name or names with special characters have been normalized afaik, 
 ## so entering Luka Doncic, Nikola Jokic, Bogdan Bovanivic(idk how to spell his name) as the name should work
 
 if __name__ == "__main__":
+    # Figures are only ever saved to PNG, so skip GUI backends (left to the caller when imported)
+    matplotlib.use('Agg')
+    
     logger.info("Starting NBA Data Scraper")
     
     # Initialize scraper once
     scraper = NBADataScraper(season="2024-25")
     
     # Example 1: Basic scraping demo
-    #demo_usage()
+    #with Pipeline(scraper) as pipeline:
+    #    asyncio.run(run_all(pipeline))
     
     # Example 2: XGBoost prediction
     try: